@@ -85,7 +85,7 @@ def load_excel_data(file_path):
         excel_file = pd.ExcelFile(file_path, engine=engine)
 
         for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel('Food_items.xls', sheet_name=sheet_name, header=None, engine=engine)
+            df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
 
             # Start from row 2 (index 2)
             for idx in range(2, len(df)):
@@ -166,21 +166,13 @@ def calculate_total():
 def complete_order():
     """Complete the order and save to CSV"""
     try:
-        from datetime import datetime, timedelta
-        from pathlib import Path
-        import csv
+        from order_log import append_order_rows, order_time_now
 
         if not st.session_state.cart:
             return False
 
-        # Create orders directory if it doesn't exist
-        orders_dir = Path("orders")
-        orders_dir.mkdir(exist_ok=True)
-
-        orders_file = orders_dir / "all_orders.csv"
-
         # Get UAE time (UTC+4)
-        uae_time = datetime.utcnow() + timedelta(hours=4)
+        uae_time = order_time_now()
         order_date = uae_time.strftime("%Y-%m-%d")
         order_time = uae_time.strftime("%H:%M:%S")
 
@@ -188,33 +180,22 @@ def complete_order():
         total = calculate_total()
         user_name = st.session_state.get('user_name', 'Guest User')
 
-        # Check if file exists to determine if we need headers
-        file_exists = orders_file.exists()
-
-        # Write to CSV
-        with open(orders_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-
-            # Write header if file is new - IN THE CORRECT ORDER
-            if not file_exists:
-                writer.writerow(['Order Date', 'Order Time', 'User Name', 'Item Name',
-                                 'Category', 'Unit', 'Quantity', 'Unit Price (AED)',
-                                 'Item Total (AED)', 'Order Total (AED)'])
-
-            # Write each item in the cart - IN THE CORRECT ORDER
-            for item in st.session_state.cart.values():
-                writer.writerow([
-                    order_date,  # Order Date
-                    order_time,  # Order Time
-                    user_name,  # User Name
-                    item['name'],  # Item Name
-                    item['category'],  # Category
-                    item['unit'],  # Unit
-                    item['quantity'],  # Quantity
-                    f"{item['price']:.2f}",  # Unit Price (AED)
-                    f"{item['price'] * item['quantity']:.2f}",  # Item Total (AED)
-                    f"{total:.2f}"  # Order Total (AED)
-                ])
+        # Write each item in the cart to this month's order log partition
+        rows = []
+        for item in st.session_state.cart.values():
+            rows.append([
+                order_date,  # Order Date
+                order_time,  # Order Time
+                user_name,  # User Name
+                item['name'],  # Item Name
+                item['category'],  # Category
+                item['unit'],  # Unit
+                item['quantity'],  # Quantity
+                f"{item['price']:.2f}",  # Unit Price (AED)
+                f"{item['price'] * item['quantity']:.2f}",  # Item Total (AED)
+                f"{total:.2f}"  # Order Total (AED)
+            ])
+        append_order_rows(rows)
 
         # Send Telegram notification
         send_telegram_notification(user_name, st.session_state.cart, total, order_date, order_time)
@@ -621,24 +602,37 @@ elif page == "👨‍💼 Manager View":
 
     st.divider()
 
-    # Define orders file path
-    from pathlib import Path
+    # Orders are stored in monthly partitions (see order_log.py)
+    from datetime import timedelta
+    from order_log import ORDERS_DIR, load_manifest, migrate_legacy_log, order_time_now, read_orders
 
-    orders_file = Path("orders/all_orders.csv")
+    # Split an old single-file log into monthly partitions on first load
+    try:
+        migrate_legacy_log()
+    except Exception as e:
+        st.error(f"❌ Could not migrate the old order log: {e}")
 
-    if orders_file.exists():
-        st.subheader("📊 All Orders Summary")
+    if load_manifest():
+        st.subheader("📊 Orders Summary")
+
+        # Only the months inside the selected range are read
+        today = order_time_now().date()
+        date_range = st.date_input("Order dates", (today - timedelta(days=30), today))
+        if isinstance(date_range, (tuple, list)):
+            start_date = date_range[0]
+            end_date = date_range[1] if len(date_range) > 1 else date_range[0]
+        else:
+            start_date = end_date = date_range
 
-        # Read the CSV file
         try:
-            df_orders = pd.read_csv(orders_file)
+            df_orders = read_orders(start_date, end_date)
 
             # Remove empty rows
             df_orders = df_orders[df_orders['Item Name'].notna()]
 
             # Check if dataframe has data
             if df_orders.empty:
-                st.info("📭 No orders in the file yet.")
+                st.info("📭 No orders in the selected date range.")
             else:
                 # Display summary statistics
                 col1, col2, col3 = st.columns(3)
@@ -675,18 +669,33 @@ elif page == "👨‍💼 Manager View":
                     mime="text/csv"
                 )
 
+            st.divider()
+
+            # Demand forecast and par levels for every catalog item. It reads its
+            # own history, so it is shown even when the selected range is empty
+            st.subheader("📈 Demand Forecast & Par Levels")
+            from forecasting import forecast_par_levels, MOVING_AVERAGE_WINDOW, LEAD_TIME_DAYS
+
+            df_forecast = forecast_par_levels(inventory['name'])
+            st.caption(f"Based on a {MOVING_AVERAGE_WINDOW}-day moving average, weekday seasonality "
+                       f"and a {LEAD_TIME_DAYS}-day delivery lead time.")
+            st.dataframe(
+                df_forecast.sort_values('Suggested Par Level', ascending=False),
+                use_container_width=True,
+                hide_index=True
+            )
 
 
         except Exception as e:
             st.error(f"Error reading orders: {e}")
-            st.info("The orders file might be empty or have a different format.")
+            st.info("The order files might be empty or have a different format.")
             import traceback
 
             st.code(traceback.format_exc())
 
     else:
         st.info("📭 No orders yet. Orders will appear here once users start ordering.")
-        st.write("Orders are saved to: `orders/all_orders.csv`")
+        st.write(f"Orders are saved to monthly files in: `{ORDERS_DIR}/`")
 
 
 # Footer
@@ -0,0 +1,105 @@
+import csv
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from order_log import LEGACY_ORDERS_FILE_NAME, ORDER_COLUMNS
+
+# ===========================================
+# SYNTHETIC WORKLOAD SETTINGS
+# ===========================================
+# The workbook uses the same layout as Food_items.xls: one sheet per
+# category, two header rows, then 3 items per row in columns 0-2, 4-6, 8-10
+CATEGORIES = ['Vegetables & Fruit', 'Meat', 'Groceries', 'Dry Goods & Drinks']
+UNITS = [('KG', 'kg'), ('500g/pkt', 'pkt'), ('12pcs/ctn', 'ctn'), ('1L/btl', 'btl')]
+ITEMS_PER_ROW = 3
+# ===========================================
+
+
+# Function to build the synthetic catalog
+def synthetic_catalog(n_items, seed=0):
+    """Return a list of {'name', 'category', 'unit', 'price'} dicts"""
+    rng = np.random.default_rng(seed)
+    items = []
+    for i in range(n_items):
+        spec, per = UNITS[rng.integers(len(UNITS))]
+        price = round(float(rng.uniform(0.5, 60)), 2)
+        items.append({
+            'name': f"Item {i:05d}",
+            'category': CATEGORIES[i % len(CATEGORIES)],
+            'unit': spec,
+            'price': price,
+            'price_label': f"{price}/{per}"
+        })
+    return items
+
+
+# Function to write a synthetic Food_items.xls workbook
+def write_catalog_workbook(path, n_items, seed=0):
+    """Write n_items spread across the category sheets. Needs xlwt."""
+    import xlwt
+
+    workbook = xlwt.Workbook(encoding='utf-8')
+    items = synthetic_catalog(n_items, seed)
+
+    for category in CATEGORIES:
+        sheet = workbook.add_sheet(category)
+        sheet.write(0, 0, "Customer: product catalog")
+        for block in range(ITEMS_PER_ROW):
+            sheet.write(1, block * 4, "Name")
+            sheet.write(1, block * 4 + 1, "Spec")
+            sheet.write(1, block * 4 + 2, "Price")
+
+        category_items = [item for item in items if item['category'] == category]
+        for position, item in enumerate(category_items):
+            row = 2 + position // ITEMS_PER_ROW
+            col = (position % ITEMS_PER_ROW) * 4
+            sheet.write(row, col, item['name'])
+            sheet.write(row, col + 1, item['unit'])
+            sheet.write(row, col + 2, item['price_label'])
+
+    workbook.save(str(path))
+    return items
+
+
+# Function to write a synthetic order log
+def write_order_log(orders_dir, items, n_days, lines_per_day, seed=0):
+    """Write orders/all_orders.csv covering the n_days up to today, in the
+    same format as complete_order(). Returns the number of rows written."""
+    rng = np.random.default_rng(seed)
+    orders_dir = Path(orders_dir)
+    orders_dir.mkdir(parents=True, exist_ok=True)
+
+    today = datetime.now().date()
+    users = [f"Chef {i}" for i in range(8)]
+    n_rows = 0
+
+    with open(orders_dir / LEGACY_ORDERS_FILE_NAME, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(ORDER_COLUMNS)
+
+        for day in range(n_days):
+            order_date = (today - timedelta(days=n_days - 1 - day)).strftime("%Y-%m-%d")
+            picks = rng.integers(0, len(items), lines_per_day)
+            quantities = rng.integers(1, 10, lines_per_day)
+
+            # Split the day's lines into orders of ~10 items
+            for start in range(0, lines_per_day, 10):
+                order_time = f"{rng.integers(6, 22):02d}:{rng.integers(60):02d}:00"
+                user_name = users[rng.integers(len(users))]
+                lines = list(zip(picks[start:start + 10], quantities[start:start + 10]))
+                total = sum(items[i]['price'] * q for i, q in lines)
+
+                for i, quantity in lines:
+                    item = items[i]
+                    writer.writerow([
+                        order_date, order_time, user_name, item['name'],
+                        item['category'], item['unit'], int(quantity),
+                        f"{item['price']:.2f}",
+                        f"{item['price'] * quantity:.2f}",
+                        f"{total:.2f}"
+                    ])
+                    n_rows += 1
+
+    return n_rows
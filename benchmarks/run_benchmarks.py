@@ -0,0 +1,257 @@
+"""End-to-end benchmarks for Food_receive_by_chef.py
+
+Builds a synthetic workbook and order log, drives the app headlessly with
+Streamlit's AppTest and writes the timings to a JSON report.
+
+    python benchmarks/run_benchmarks.py --items 900 --order-days 365
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/old.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCHMARKS_DIR.parent
+sys.path.insert(0, str(REPO_DIR))
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from generate_workload import write_catalog_workbook, write_order_log
+from order_log import ORDER_COLUMNS, append_order_rows, migrate_legacy_log
+
+# ===========================================
+# BENCHMARK SETTINGS
+# ===========================================
+APP_FILES = ['Food_receive_by_chef.py', 'order_log.py', 'forecasting.py']
+EXCEL_FILE_NAME = "Food_items.xls"
+RESULTS_DIR = BENCHMARKS_DIR / "results"
+APP_TIMEOUT = 300  # Seconds allowed for a single script run
+# ===========================================
+
+CART_PAGE = "🛒 Cart"
+MANAGER_PAGE = "👨‍💼 Manager View"
+
+
+# Function to copy the app next to the synthetic workbook
+def prepare_workspace(workspace, n_items, n_order_days, lines_per_day, seed):
+    """The app looks for Food_items.xls next to the script and writes
+    orders/ relative to the working directory, so both live in workspace"""
+    for file_name in APP_FILES:
+        shutil.copy(REPO_DIR / file_name, workspace / file_name)
+
+    items = write_catalog_workbook(workspace / EXCEL_FILE_NAME, n_items, seed)
+    n_rows = write_order_log(workspace / "orders", items, n_order_days, lines_per_day, seed)
+
+    started = time.perf_counter()
+    migrate_legacy_log(workspace / "orders")
+    migration_seconds = time.perf_counter() - started
+
+    return items, n_rows, migration_seconds
+
+
+# Function to time one step of the app
+def timed(step):
+    """Run step() and return (seconds, AppTest). Fails on app exceptions and
+    on errors the app catches itself and shows with st.error."""
+    started = time.perf_counter()
+    at = step()
+    seconds = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError(f"App raised: {at.exception[0].message}")
+    if at.error:
+        raise RuntimeError(f"App showed an error: {at.error[0].value}")
+    return seconds, at
+
+
+# Function to skip the app's own pauses while it is benchmarked
+@contextmanager
+def skip_app_sleeps(script):
+    """The app sleeps 2 seconds after an order so the user sees the
+    confirmation. Those calls return at once; any other caller still sleeps."""
+    real_sleep = time.sleep
+    script = str(script)
+
+    def sleep(seconds):
+        if sys._getframe(1).f_code.co_filename != script:
+            real_sleep(seconds)
+
+    time.sleep = sleep
+    try:
+        yield
+    finally:
+        time.sleep = real_sleep
+
+
+# Function to start a logged-in app session
+def new_session(script):
+    at = AppTest.from_file(str(script), default_timeout=APP_TIMEOUT)
+    at.session_state["user_name"] = "Benchmark Chef"
+
+    # Empty secrets keep Google Sheets and Telegram switched off
+    for key in ("GOOGLE_SCRIPT_URL", "BOT_TOKEN", "CHAT_ID"):
+        at.secrets[key] = ""
+    return at
+
+
+# Function to run every scenario once
+def run_scenarios(script, items):
+    """Return {scenario: seconds} for one pass over the app"""
+    results = {}
+
+    # Catalog load: a fresh session with an empty st.cache_data
+    st.cache_data.clear()
+    at = new_session(script)
+    results['catalog_load_cold'], at = timed(at.run)
+
+    at = new_session(script)
+    results['catalog_load_warm'], at = timed(at.run)
+
+    # Browse render: rerun the full item list with a warm cache
+    results['browse_render'], at = timed(at.run)
+
+    # Search: a query matching 10 items ("Item 0045" -> Item 00450-00459)
+    query = items[len(items) // 2]['name'][:-1]
+    results['search'], at = timed(at.text_input(key="search").input(query).run)
+    results['search_clear'], at = timed(at.text_input(key="search").input("").run)
+
+    # Cart ops: add, increase, decrease, remove
+    first_id, second_id = 1, 2
+    results['cart_add'], at = timed(at.button(key=f"add_{first_id}").click().run)
+    timed(at.button(key=f"add_{second_id}").click().run)
+
+    _, at = timed(at.radio[0].set_value(CART_PAGE).run)
+    results['cart_render'], at = timed(at.run)
+    results['cart_increase'], at = timed(at.button(key=f"inc_{first_id}").click().run)
+    results['cart_decrease'], at = timed(at.button(key=f"dec_{first_id}").click().run)
+    results['cart_remove'], at = timed(at.button(key=f"del_{second_id}").click().run)
+
+    # Order commit through the UI, without the app's confirmation pause
+    complete = [button for button in at.button if button.label == "✅ Complete Order"][0]
+    results['order_commit'], at = timed(complete.click().run)
+    if at.session_state["cart"]:
+        raise RuntimeError("Order commit did not empty the cart")
+
+    # Manager View: default date range (last 30 days)
+    at.session_state["manager_authenticated"] = True
+    results['manager_view_load'], at = timed(at.radio[0].set_value(MANAGER_PAGE).run)
+    results['manager_view_reload'], at = timed(at.run)
+
+    return results
+
+
+# Function to time the order log writer on its own
+def time_order_append(workspace, items, n_orders=20):
+    """Average seconds to append one 10-line order to the partitioned log"""
+    today = datetime.now().strftime("%Y-%m-%d")
+    started = time.perf_counter()
+    for n in range(n_orders):
+        rows = [[today, f"23:{n:02d}:00", "Benchmark Chef", item['name'], item['category'],
+                 item['unit'], 1, f"{item['price']:.2f}", f"{item['price']:.2f}", "0.00"]
+                for item in items[:10]]
+        append_order_rows(rows, workspace / "orders")
+    return (time.perf_counter() - started) / n_orders
+
+
+# Function to find the commit being benchmarked
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+# Function to print a comparison with an earlier report
+def compare_reports(report, baseline_file):
+    with open(baseline_file, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    print(f"\nCompared with {baseline['commit']} ({baseline_file}):")
+    if baseline['workload'] != report['workload']:
+        print("  Warning: the workloads differ, timings are not directly comparable")
+    for name, stats in report['results'].items():
+        old = baseline['results'].get(name)
+        if old is None or not old['median']:
+            print(f"  {name:24s} {stats['median']:9.4f}s  (new)")
+            continue
+        change = (stats['median'] - old['median']) / old['median'] * 100
+        print(f"  {name:24s} {stats['median']:9.4f}s  vs {old['median']:9.4f}s  ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=900, help="catalog size")
+    parser.add_argument('--order-days', type=int, default=365, help="days of order history")
+    parser.add_argument('--lines-per-day', type=int, default=50, help="order lines per day")
+    parser.add_argument('--repeat', type=int, default=3, help="passes over every scenario")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, help="report file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument('--compare', type=Path, help="earlier report to compare against")
+    args = parser.parse_args()
+    if args.items < 2:
+        parser.error("--items must be at least 2: the cart scenarios use two different items")
+
+    original_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = Path(tmp)
+        items, n_rows, migration_seconds = prepare_workspace(
+            workspace, args.items, args.order_days, args.lines_per_day, args.seed)
+        print(f"Workload: {len(items)} items, {n_rows:,} order lines over {args.order_days} days")
+
+        os.chdir(workspace)
+        try:
+            passes = []
+            for n in range(args.repeat):
+                with skip_app_sleeps(workspace / APP_FILES[0]):
+                    passes.append(run_scenarios(workspace / APP_FILES[0], items))
+                print(f"  pass {n + 1}/{args.repeat} done")
+            append_seconds = time_order_append(workspace, items)
+        finally:
+            os.chdir(original_dir)
+
+    results = {name: {'median': statistics.median(p[name] for p in passes),
+                      'min': min(p[name] for p in passes),
+                      'max': max(p[name] for p in passes)}
+               for name in passes[0]}
+    results['order_log_append'] = {'median': append_seconds, 'min': append_seconds, 'max': append_seconds}
+    results['order_log_migration'] = {'median': migration_seconds, 'min': migration_seconds,
+                                      'max': migration_seconds}
+
+    report = {
+        'commit': git_commit(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'streamlit': st.__version__,
+        'workload': {'items': len(items), 'order_days': args.order_days,
+                     'lines_per_day': args.lines_per_day, 'order_lines': n_rows,
+                     'order_columns': len(ORDER_COLUMNS), 'repeat': args.repeat, 'seed': args.seed},
+        'results': results
+    }
+
+    output = args.output or RESULTS_DIR / f"{report['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n{'scenario':24s} {'median':>10s} {'min':>10s} {'max':>10s}")
+    for name, stats in results.items():
+        print(f"{name:24s} {stats['median']:9.4f}s {stats['min']:9.4f}s {stats['max']:9.4f}s")
+    print(f"\nReport written to {output}")
+
+    if args.compare:
+        compare_reports(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from order_log import ORDERS_DIR, log_version, order_time_now, read_orders
+
+# ===========================================
+# FORECAST SETTINGS
+# ===========================================
+HISTORY_DAYS = 365           # Only the most recent partitions are read
+MOVING_AVERAGE_WINDOW = 28   # Days of history used for the base demand
+LEAD_TIME_DAYS = 2           # Days between placing and receiving a purchase
+SAFETY_FACTOR = 1.65         # ~95% service level
+# ===========================================
+
+# Results are kept here until new orders are written
+_forecast_cache = {}
+
+
+# Function to read per-item daily quantities from the order log
+def load_order_quantities(orders_dir=ORDERS_DIR, start_date=None):
+    """Read only the columns needed for forecasting from the order log"""
+    df = read_orders(start_date, columns=['Order Date', 'Item Name', 'Quantity'],
+                     orders_dir=orders_dir)
+    df = df[df['Item Name'].notna()]
+
+    return pd.DataFrame({
+        'date': pd.to_datetime(df['Order Date'], errors='coerce').to_numpy(),
+        'item': df['Item Name'].astype(str).str.strip().to_numpy(),
+        'quantity': pd.to_numeric(df['Quantity'], errors='coerce').fillna(0).to_numpy()
+    }).dropna(subset=['date'])
+
+
+# Function to build the dense item x day quantity matrix
+def build_quantity_matrix(orders, item_names=None, start_date=None, end_date=None):
+    """Return (matrix, item_names, dates) where matrix[i, d] is the quantity
+    of item_names[i] ordered on dates[d]. Days without orders are zero.
+    The day axis runs from start_date to end_date (default: the first and
+    last order) so quiet days at the end still count as zero demand."""
+    if item_names is None:
+        item_names = pd.unique(orders['item'])
+    item_names = pd.Index(pd.unique(np.asarray(item_names, dtype=object)))
+
+    days = orders['date'].to_numpy().astype('datetime64[D]')
+    if start_date is None and len(days):
+        start_date = days.min()
+    if end_date is None and len(days):
+        end_date = days.max()
+    if start_date is None or end_date is None:
+        return np.zeros((len(item_names), 0)), item_names, pd.DatetimeIndex([])
+
+    start = np.datetime64(start_date, 'D')
+    n_days = max(int((np.datetime64(end_date, 'D') - start).astype(int)) + 1, 0)
+    dates = pd.date_range(start, periods=n_days, freq='D')
+
+    # Items that are not in the catalog any more and orders outside the
+    # date range are dropped
+    item_idx = item_names.get_indexer(orders['item'])
+    day_idx = (days - start).astype(np.int64)
+    known = (item_idx >= 0) & (day_idx >= 0) & (day_idx < n_days)
+
+    flat = item_idx[known].astype(np.int64) * n_days + day_idx[known]
+    matrix = np.bincount(flat, weights=orders['quantity'].to_numpy()[known],
+                         minlength=len(item_names) * n_days)
+
+    return matrix.reshape(len(item_names), n_days).astype(float, copy=False), item_names, dates
+
+
+# Function to calculate trailing moving averages for every item
+def moving_average(matrix, window=MOVING_AVERAGE_WINDOW):
+    """Trailing moving average along the day axis. Early days average over
+    the history available so far."""
+    n_days = matrix.shape[1]
+    if n_days == 0:
+        return np.zeros_like(matrix, dtype=float)
+
+    cumulative = np.cumsum(matrix, axis=1, dtype=float)
+    shifted = np.zeros_like(cumulative)
+    if n_days > window:
+        shifted[:, window:] = cumulative[:, :-window]
+
+    counts = np.minimum(np.arange(1, n_days + 1), window)
+    return (cumulative - shifted) / counts
+
+
+# Function to calculate weekday seasonality for every item
+def weekday_seasonality(matrix, dates):
+    """Return an (items x 7) array of weekday factors, Monday first.
+    A factor of 1.0 means an average day; items with no orders and weekdays
+    that are not in the history yet get 1.0."""
+    weekdays = np.asarray(dates.dayofweek)
+    weekday_onehot = (weekdays[:, None] == np.arange(7)).astype(float)
+    sums = matrix @ weekday_onehot
+
+    day_counts = np.bincount(weekdays, minlength=7).astype(float)
+    weekday_means = np.divide(sums, day_counts, out=np.zeros_like(sums),
+                              where=day_counts > 0)
+
+    overall_mean = matrix.mean(axis=1, keepdims=True) if matrix.shape[1] else np.zeros((matrix.shape[0], 1))
+    return np.divide(weekday_means, overall_mean, out=np.ones_like(weekday_means),
+                     where=(overall_mean > 0) & (day_counts > 0))
+
+
+# Function to suggest par levels for every item
+def suggest_par_levels(matrix, dates, window=MOVING_AVERAGE_WINDOW,
+                       lead_time_days=LEAD_TIME_DAYS, safety_factor=SAFETY_FACTOR):
+    """Par level = expected demand over the lead time (moving average scaled
+    by the weekday factors of the coming days) plus safety stock."""
+    n_items = matrix.shape[0]
+    if matrix.shape[1] == 0:
+        zeros = np.zeros(n_items)
+        return zeros, zeros, np.ones((n_items, 7)), zeros
+
+    daily_average = moving_average(matrix, window)[:, -1]
+    seasonality = weekday_seasonality(matrix, dates)
+
+    recent = matrix[:, -window:]
+    daily_std = recent.std(axis=1)
+
+    # Weekday factors for the days covered by the next delivery
+    next_weekdays = (dates[-1].dayofweek + np.arange(1, lead_time_days + 1)) % 7
+    expected_demand = daily_average * seasonality[:, next_weekdays].sum(axis=1)
+
+    safety_stock = safety_factor * daily_std * np.sqrt(lead_time_days)
+    par_levels = np.ceil(expected_demand + safety_stock)
+
+    return par_levels, daily_average, seasonality, safety_stock
+
+
+# Function to build the forecast table shown in the Manager View
+def forecast_par_levels(catalog_names, orders_dir=ORDERS_DIR, history_days=HISTORY_DAYS,
+                        window=MOVING_AVERAGE_WINDOW, lead_time_days=LEAD_TIME_DAYS,
+                        safety_factor=SAFETY_FACTOR):
+    """Forecast every catalog item at once from the last history_days of
+    orders. Results are cached until new orders update the manifest."""
+    catalog_names = pd.Index(pd.unique(np.asarray(catalog_names, dtype=object)))
+    today = order_time_now().date()
+    start_date = today - timedelta(days=history_days)
+    cache_key = (str(Path(orders_dir).resolve()), log_version(orders_dir), start_date,
+                 tuple(catalog_names), window, lead_time_days, safety_factor)
+    if cache_key in _forecast_cache:
+        return _forecast_cache[cache_key]
+
+    orders = load_order_quantities(orders_dir, start_date)
+    # History starts at the first order in the window and runs up to today
+    matrix, item_names, dates = build_quantity_matrix(orders, catalog_names, end_date=today)
+    par_levels, daily_average, seasonality, safety_stock = suggest_par_levels(
+        matrix, dates, window, lead_time_days, safety_factor)
+
+    # Busiest day among the weekdays in the history; none for unordered items
+    weekday_labels = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    seen_weekdays = np.bincount(np.asarray(dates.dayofweek), minlength=7) > 0
+    busiest = np.where(seen_weekdays, seasonality, -np.inf).argmax(axis=1)
+    ordered = matrix.sum(axis=1) > 0
+
+    result = pd.DataFrame({
+        'Item Name': item_names,
+        'Avg Daily Qty': daily_average.round(2),
+        'Busiest Day': [weekday_labels[i] if has_orders else "—"
+                        for i, has_orders in zip(busiest, ordered)],
+        'Safety Stock': safety_stock.round(2),
+        'Suggested Par Level': par_levels.astype(int)
+    })
+
+    # Only the latest version of the order log is worth keeping
+    _forecast_cache.clear()
+    _forecast_cache[cache_key] = result
+    return result
+
+
+# Benchmark: python forecasting.py [items] [days] [orders_per_day]
+if __name__ == "__main__":
+    import sys
+
+    n_items = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_days = int(sys.argv[2]) if len(sys.argv) > 2 else 3 * 365
+    lines_per_day = int(sys.argv[3]) if len(sys.argv) > 3 else 400
+
+    rng = np.random.default_rng(0)
+    catalog = np.array([f"Item {i}" for i in range(n_items)], dtype=object)
+    n_lines = n_days * lines_per_day
+    history = pd.date_range(end=pd.Timestamp.now().normalize(), periods=n_days, freq='D')
+    orders = pd.DataFrame({
+        'date': np.repeat(history, lines_per_day),
+        'item': catalog[rng.integers(0, n_items, n_lines)],
+        'quantity': rng.integers(1, 10, n_lines).astype(float)
+    })
+
+    print(f"{n_items} items x {n_days} days, {n_lines:,} order lines")
+
+    started = time.perf_counter()
+    matrix, item_names, dates = build_quantity_matrix(orders, catalog)
+    print(f"  quantity matrix:  {time.perf_counter() - started:.3f}s")
+
+    started = time.perf_counter()
+    par_levels = suggest_par_levels(matrix, dates)[0]
+    print(f"  par levels:       {time.perf_counter() - started:.3f}s")
+
+    import tempfile
+    from order_log import LEGACY_ORDERS_FILE_NAME, ORDER_COLUMNS, migrate_legacy_log
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_log = pd.DataFrame('', index=orders.index, columns=ORDER_COLUMNS)
+        legacy_log['Order Date'] = orders['date'].dt.strftime('%Y-%m-%d')
+        legacy_log['Item Name'] = orders['item']
+        legacy_log['Quantity'] = orders['quantity'].astype(int)
+        legacy_log.to_csv(Path(tmp) / LEGACY_ORDERS_FILE_NAME, index=False)
+
+        started = time.perf_counter()
+        migrate_legacy_log(tmp)
+        print(f"  log migration:    {time.perf_counter() - started:.3f}s")
+
+        started = time.perf_counter()
+        forecast_par_levels(catalog, tmp, history_days=n_days)
+        print(f"  full forecast:    {time.perf_counter() - started:.3f}s (from partitions)")
+
+        started = time.perf_counter()
+        forecast_par_levels(catalog, tmp, history_days=n_days)
+        print(f"  cached forecast:  {time.perf_counter() - started:.6f}s")
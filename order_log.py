@@ -0,0 +1,369 @@
+import csv
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# ===========================================
+# ORDER LOG SETTINGS
+# ===========================================
+# Orders are stored as one CSV per month (orders/2024-05.csv). Months before
+# the current one are gzip-compressed (orders/2024-04.csv.gz). A small
+# manifest lists every partition with its date range so readers only open
+# the months they need.
+ORDERS_DIR = Path("orders")
+LEGACY_ORDERS_FILE_NAME = "all_orders.csv"
+MANIFEST_FILE_NAME = "manifest.json"
+LOCK_FILE_NAME = ".lock"
+ORDER_UTC_OFFSET_HOURS = 4  # Orders are stamped in UAE time (UTC+4)
+READ_ATTEMPTS = 5           # Re-reads when a partition is replaced mid-read
+
+ORDER_COLUMNS = ['Order Date', 'Order Time', 'User Name', 'Item Name',
+                 'Category', 'Unit', 'Quantity', 'Unit Price (AED)',
+                 'Item Total (AED)', 'Order Total (AED)']
+# ===========================================
+
+# Streamlit runs every session as a thread of one process
+_log_lock = threading.Lock()
+
+
+# Function to get the current time in the order timezone
+def order_time_now():
+    """Current UAE time, used for order stamps and for 'today' in the views"""
+    utc_now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return utc_now + timedelta(hours=ORDER_UTC_OFFSET_HOURS)
+
+
+# Function to give one caller at a time access to the order log
+@contextmanager
+def _locked(orders_dir):
+    """Thread lock for sessions in this process, plus a file lock for other
+    processes writing to the same orders folder"""
+    orders_dir = Path(orders_dir)
+    with _log_lock:
+        orders_dir.mkdir(parents=True, exist_ok=True)
+        with open(orders_dir / LOCK_FILE_NAME, 'a+') as lock_file:
+            lock_file.seek(0)
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _read_manifest_file(orders_dir):
+    manifest_file = Path(orders_dir) / MANIFEST_FILE_NAME
+    if not manifest_file.exists():
+        return {'partitions': {}}
+    with open(manifest_file, encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Function to load the partition manifest
+def load_manifest(orders_dir=ORDERS_DIR):
+    """Return {month: {'file', 'first_date', 'last_date', 'rows', 'compressed'}}"""
+    return _read_manifest_file(orders_dir)['partitions']
+
+
+# Function to save the partition manifest
+def save_manifest(partitions, orders_dir=ORDERS_DIR, migrated_legacy=None):
+    """Write the manifest atomically so readers never see half a file.
+    Callers must hold the order log lock."""
+    orders_dir = Path(orders_dir)
+    manifest = {'partitions': dict(sorted(partitions.items()))}
+
+    # Keep the record of the last legacy migration unless a new one is given
+    if migrated_legacy is None:
+        migrated_legacy = _read_manifest_file(orders_dir).get('migrated_legacy')
+    if migrated_legacy is not None:
+        manifest['migrated_legacy'] = migrated_legacy
+
+    with tempfile.NamedTemporaryFile('w', dir=orders_dir, prefix=MANIFEST_FILE_NAME + '.',
+                                     suffix='.tmp', delete=False, encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(f.name, orders_dir / MANIFEST_FILE_NAME)
+
+
+# Function to get a value that changes whenever new orders are written
+def log_version(orders_dir=ORDERS_DIR):
+    """Used as a cache key by readers of the order log"""
+    try:
+        stat = os.stat(Path(orders_dir) / MANIFEST_FILE_NAME)
+        return stat.st_mtime_ns, stat.st_size
+    except FileNotFoundError:
+        return None
+
+
+def _copy_atomically(source, target, open_source, open_target):
+    """Copy source to target through a temporary file in the same folder"""
+    with tempfile.NamedTemporaryFile(dir=target.parent, prefix=target.name + '.',
+                                     suffix='.tmp', delete=False) as tmp:
+        pass
+    with open_source(source, 'rb') as f_in, open_target(tmp.name, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.replace(tmp.name, target)
+
+
+# Function to gzip every partition older than the given month
+def compress_old_partitions(current_month, orders_dir=ORDERS_DIR):
+    """Compress closed months. Returns the updated manifest."""
+    with _locked(orders_dir):
+        return _compress_old_partitions(current_month, Path(orders_dir), load_manifest(orders_dir))
+
+
+def _compress_old_partitions(current_month, orders_dir, partitions):
+    for month, info in partitions.items():
+        if month >= current_month or info['compressed']:
+            continue
+
+        source = orders_dir / info['file']
+        target = orders_dir / f"{month}.csv.gz"
+        _copy_atomically(source, target, open, gzip.open)
+
+        info['file'] = target.name
+        info['compressed'] = True
+        save_manifest(partitions, orders_dir)
+        source.unlink()
+
+    return partitions
+
+
+# Function to append order rows to the monthly partitions
+def append_order_rows(rows, orders_dir=ORDERS_DIR):
+    """Append rows (lists in ORDER_COLUMNS order) to the partition of their
+    month and update the manifest"""
+    orders_dir = Path(orders_dir)
+
+    rows_by_month = {}
+    for row in rows:
+        rows_by_month.setdefault(str(row[0])[:7], []).append(row)
+
+    with _locked(orders_dir):
+        partitions = load_manifest(orders_dir)
+        stale_files = []
+
+        for month, month_rows in rows_by_month.items():
+            info = partitions.get(month)
+
+            # A late order for a closed month reopens its partition
+            if info is not None and info['compressed']:
+                stale_files.append(orders_dir / info['file'])
+                _decompress_partition(month, info, orders_dir)
+
+            partition_file = orders_dir / (info['file'] if info is not None else f"{month}.csv")
+            file_exists = partition_file.exists()
+
+            with open(partition_file, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if not file_exists:
+                    writer.writerow(ORDER_COLUMNS)
+                writer.writerows(month_rows)
+
+            dates = [str(row[0]) for row in month_rows]
+            if info is None:
+                info = {'file': partition_file.name, 'first_date': min(dates),
+                        'last_date': max(dates), 'rows': 0, 'compressed': False}
+                partitions[month] = info
+            info['first_date'] = min(info['first_date'], min(dates))
+            info['last_date'] = max(info['last_date'], max(dates))
+            info['rows'] += len(month_rows)
+
+        save_manifest(partitions, orders_dir)
+        for stale_file in stale_files:
+            stale_file.unlink(missing_ok=True)
+
+        # Months before the newest one are closed and can be compressed
+        if partitions:
+            _compress_old_partitions(max(partitions), orders_dir, partitions)
+
+
+def _decompress_partition(month, info, orders_dir):
+    """Unzip a closed month. The .gz file is removed by the caller once the
+    manifest no longer refers to it."""
+    target = orders_dir / f"{month}.csv"
+    _copy_atomically(orders_dir / info['file'], target, gzip.open, open)
+    info['file'] = target.name
+    info['compressed'] = False
+
+
+# Function to list the partitions that overlap a date range
+def partitions_for_range(start_date=None, end_date=None, orders_dir=ORDERS_DIR):
+    """Dates are 'YYYY-MM-DD' strings or date objects; None means open-ended"""
+    start_date = str(start_date) if start_date is not None else None
+    end_date = str(end_date) if end_date is not None else None
+
+    selected = []
+    for month, info in sorted(load_manifest(orders_dir).items()):
+        if start_date is not None and info['last_date'] < start_date:
+            continue
+        if end_date is not None and info['first_date'] > end_date:
+            continue
+        selected.append(Path(orders_dir) / info['file'])
+    return selected
+
+
+# Function to read orders for a date range
+def read_orders(start_date=None, end_date=None, columns=None, orders_dir=ORDERS_DIR):
+    """Read orders between start_date and end_date (inclusive), opening only
+    the monthly partitions that overlap the range"""
+    usecols = None if columns is None else list(dict.fromkeys(['Order Date'] + list(columns)))
+    if not Path(orders_dir).exists():
+        return pd.DataFrame(columns=usecols or ORDER_COLUMNS)
+
+    # Read without the lock so order commits never wait for a report. If a
+    # month is compressed or reopened meanwhile, its old file is gone: start
+    # again from the new manifest.
+    for attempt in range(READ_ATTEMPTS):
+        try:
+            frames = [pd.read_csv(path, usecols=usecols)
+                      for path in partitions_for_range(start_date, end_date, orders_dir)]
+            break
+        except FileNotFoundError:
+            if attempt == READ_ATTEMPTS - 1:
+                raise
+    if not frames:
+        return pd.DataFrame(columns=usecols or ORDER_COLUMNS)
+
+    df = pd.concat(frames, ignore_index=True)
+
+    # Trim the first and last month to the exact range
+    order_dates = df['Order Date'].astype(str)
+    in_range = pd.Series(True, index=df.index)
+    if start_date is not None:
+        in_range &= order_dates >= str(start_date)
+    if end_date is not None:
+        in_range &= order_dates <= str(end_date)
+    df = df[in_range]
+
+    if columns is not None:
+        df = df[list(columns)]
+    return df.reset_index(drop=True)
+
+
+# Function to split the old single-file order log into monthly partitions
+def migrate_legacy_log(orders_dir=ORDERS_DIR):
+    """Move orders/all_orders.csv into monthly partitions. The old file is
+    kept as all_orders.csv.migrated. Returns True if a migration happened.
+    Raises ValueError if the old file does not have the expected header."""
+    if not (Path(orders_dir) / LEGACY_ORDERS_FILE_NAME).exists():
+        return False
+    with _locked(orders_dir):
+        return _migrate_legacy_log(Path(orders_dir))
+
+
+def _migrate_legacy_log(orders_dir):
+    legacy_file = orders_dir / LEGACY_ORDERS_FILE_NAME
+    if not legacy_file.exists():
+        return False
+
+    stat = legacy_file.stat()
+    legacy_id = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    token = uuid.uuid4().hex[:8]
+
+    migrated_file = legacy_file.with_name(LEGACY_ORDERS_FILE_NAME + '.migrated')
+    if migrated_file.exists():
+        migrated_file = legacy_file.with_name(f"{LEGACY_ORDERS_FILE_NAME}.{token}.migrated")
+
+    # An earlier migration of this file stopped after saving the manifest,
+    # so its rows are already partitioned: only the rename is left to do
+    if _read_manifest_file(orders_dir).get('migrated_legacy') == legacy_id:
+        os.replace(legacy_file, migrated_file)
+        return True
+
+    if stat.st_size == 0:
+        os.replace(legacy_file, migrated_file)
+        return True
+
+    df = pd.read_csv(legacy_file, dtype=str, keep_default_na=False)
+    missing = [column for column in ORDER_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"Cannot migrate {legacy_file}: missing columns {', '.join(missing)}. "
+                         f"Expected header: {', '.join(ORDER_COLUMNS)}")
+
+    # Excel re-saves dates as e.g. 1/6/2024; partitions use YYYY-MM-DD
+    df = df[(df['Item Name'].str.strip() != '') & (df['Order Date'].str.strip() != '')].copy()
+    df['Order Date'] = _normalise_order_dates(df['Order Date'], legacy_file)
+
+    # Merge the legacy rows in front of anything already partitioned
+    old_partitions = load_manifest(orders_dir)
+    frames = [df[ORDER_COLUMNS]]
+    for info in old_partitions.values():
+        frames.append(pd.read_csv(orders_dir / info['file'], dtype=str,
+                                  keep_default_na=False)[ORDER_COLUMNS])
+    df = pd.concat(frames, ignore_index=True)
+    df = df[(df['Item Name'].str.strip() != '') & (df['Order Date'].str.strip() != '')]
+
+    # Write the merged months under new names. Nothing refers to them until
+    # the manifest is replaced, so a crash here leaves the old log intact.
+    months = df['Order Date'].str[:7]
+    newest_month = months.max() if len(df) else None
+    partitions = {}
+    for month, month_df in df.groupby(months, sort=True):
+        compressed = month < newest_month
+        partition_file = orders_dir / (f"{month}.{token}.csv" + ('.gz' if compressed else ''))
+        month_df.to_csv(partition_file, index=False, compression='gzip' if compressed else None)
+        partitions[month] = {'file': partition_file.name,
+                             'first_date': month_df['Order Date'].min(),
+                             'last_date': month_df['Order Date'].max(),
+                             'rows': len(month_df), 'compressed': compressed}
+
+    # Replacing the manifest is the switch-over. It records which legacy
+    # file it contains, so an interrupted rename is finished next time
+    # instead of merging the same rows again.
+    save_manifest(partitions, orders_dir, migrated_legacy=legacy_id)
+    os.replace(legacy_file, migrated_file)
+
+    for info in old_partitions.values():
+        (orders_dir / info['file']).unlink(missing_ok=True)
+    return True
+
+
+def _normalise_order_dates(order_dates, source):
+    """Return the dates as 'YYYY-MM-DD'. Other formats are converted, reading
+    slash dates month first as Excel does. Raises ValueError naming the CSV
+    lines whose date cannot be read."""
+    values = order_dates.str.strip()
+    parsed = pd.to_datetime(values, format='%Y-%m-%d', errors='coerce')
+    other_format = parsed.isna()
+    if other_format.any():
+        parsed[other_format] = pd.to_datetime(values[other_format], format='mixed', errors='coerce')
+
+    unreadable = parsed.isna()
+    if unreadable.any():
+        # +2 for the header line and 1-based line numbers
+        lines = ', '.join(str(i + 2) for i in order_dates.index[unreadable][:10])
+        raise ValueError(f"Cannot migrate {source}: unreadable Order Date on line(s) {lines}")
+    return parsed.dt.strftime('%Y-%m-%d')
+
+
+# Migration step: python order_log.py [orders_dir]
+if __name__ == "__main__":
+    import sys
+
+    target_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else ORDERS_DIR
+    if migrate_legacy_log(target_dir):
+        for month, info in sorted(load_manifest(target_dir).items()):
+            print(f"{month}: {info['rows']} rows -> {info['file']}")
+    else:
+        print(f"Nothing to migrate: {target_dir / LEGACY_ORDERS_FILE_NAME} not found")
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+import forecasting
+from forecasting import (build_quantity_matrix, forecast_par_levels, moving_average,
+                         suggest_par_levels, weekday_seasonality)
+from order_log import append_order_rows, log_version, order_time_now
+
+
+def orders_frame(rows):
+    """rows: (date, item, quantity) tuples"""
+    return pd.DataFrame({
+        'date': pd.to_datetime([date for date, _, _ in rows]),
+        'item': [item for _, item, _ in rows],
+        'quantity': [float(quantity) for _, _, quantity in rows]
+    })
+
+
+def order_row(order_date, item, quantity):
+    return [str(order_date), "10:00:00", "Chef", item, "Vegetables", "KG", quantity,
+            "1.00", f"{quantity:.2f}", f"{quantity:.2f}"]
+
+
+def test_moving_average_matches_pandas_rolling():
+    rng = np.random.default_rng(0)
+    matrix = rng.integers(0, 10, (5, 60)).astype(float)
+
+    expected = pd.DataFrame(matrix.T).rolling(7, min_periods=1).mean().to_numpy().T
+    np.testing.assert_allclose(moving_average(matrix, 7), expected)
+
+    # Window longer than the history
+    expected = pd.DataFrame(matrix.T).rolling(90, min_periods=1).mean().to_numpy().T
+    np.testing.assert_allclose(moving_average(matrix, 90), expected)
+
+
+def test_quantity_matrix_sums_orders_per_item_and_day():
+    orders = orders_frame([("2024-01-01", "A", 2), ("2024-01-01", "A", 3),
+                           ("2024-01-03", "B", 4)])
+    matrix, item_names, dates = build_quantity_matrix(orders, ["A", "B"])
+
+    assert list(item_names) == ["A", "B"]
+    assert list(dates.strftime("%Y-%m-%d")) == ["2024-01-01", "2024-01-02", "2024-01-03"]
+    np.testing.assert_array_equal(matrix, [[5, 0, 0], [0, 0, 4]])
+
+
+def test_quiet_trailing_days_count_as_zero_demand():
+    orders = orders_frame([("2024-01-01", "A", 7)])
+    matrix, _, dates = build_quantity_matrix(orders, ["A"], end_date="2024-01-07")
+
+    assert matrix.shape == (1, 7)
+    assert dates[-1] == pd.Timestamp("2024-01-07")
+    assert moving_average(matrix, 7)[0, -1] == 1.0
+
+
+def test_items_not_in_catalog_are_dropped():
+    orders = orders_frame([("2024-01-01", "A", 1), ("2024-01-01", "Retired", 9)])
+    matrix, item_names, _ = build_quantity_matrix(orders, ["A", "New"])
+
+    assert list(item_names) == ["A", "New"]
+    np.testing.assert_array_equal(matrix, [[1], [0]])
+
+
+def test_weekday_seasonality_for_short_history():
+    # 2024-01-01 is a Monday; only Monday and Tuesday are in the history
+    dates = pd.date_range("2024-01-01", periods=2, freq='D')
+    seasonality = weekday_seasonality(np.array([[4.0, 0.0], [0.0, 0.0]]), dates)
+
+    np.testing.assert_allclose(seasonality[0], [2, 0, 1, 1, 1, 1, 1])
+    np.testing.assert_allclose(seasonality[1], np.ones(7))
+
+
+def test_par_levels_with_less_than_a_week_of_history():
+    orders = orders_frame([("2024-01-01", "A", 3)])
+    matrix, _, dates = build_quantity_matrix(orders, ["A", "B"])
+
+    par_levels, daily_average, _, _ = suggest_par_levels(matrix, dates, window=28,
+                                                         lead_time_days=2, safety_factor=0)
+    assert daily_average[0] == 3.0
+    assert par_levels[0] == 6
+    assert par_levels[1] == 0
+
+
+def test_forecast_table_for_unordered_items(tmp_path):
+    today = order_time_now().date()
+    append_order_rows([order_row(today, "A", 3)], tmp_path)
+
+    result = forecast_par_levels(["A", "B"], tmp_path).set_index('Item Name')
+    assert result.loc["A", 'Suggested Par Level'] > 0
+    assert result.loc["A", 'Busiest Day'] == today.strftime("%a")
+    assert result.loc["B", 'Busiest Day'] == "—"
+    assert result.loc["B", 'Suggested Par Level'] == 0
+
+
+def test_new_orders_invalidate_the_forecast_cache(tmp_path, monkeypatch):
+    today = order_time_now().date()
+    append_order_rows([order_row(today, "A", 3)], tmp_path)
+
+    loads = []
+    real_load = forecasting.load_order_quantities
+
+    def counting_load(*args, **kwargs):
+        loads.append(1)
+        return real_load(*args, **kwargs)
+
+    monkeypatch.setattr(forecasting, 'load_order_quantities', counting_load)
+
+    first = forecast_par_levels(["A"], tmp_path)
+    assert forecast_par_levels(["A"], tmp_path) is first
+    assert len(loads) == 1
+
+    version = log_version(tmp_path)
+    append_order_rows([order_row(today, "A", 30)], tmp_path)
+    assert log_version(tmp_path) != version
+
+    second = forecast_par_levels(["A"], tmp_path)
+    assert len(loads) == 2
+    assert second['Avg Daily Qty'].iloc[0] > first['Avg Daily Qty'].iloc[0]
@@ -0,0 +1,213 @@
+import csv
+import threading
+
+import pandas as pd
+import pytest
+
+import order_log
+from order_log import (LEGACY_ORDERS_FILE_NAME, ORDER_COLUMNS, append_order_rows,
+                       load_manifest, migrate_legacy_log, partitions_for_range, read_orders)
+
+
+def order_row(order_date, item="Tomato", quantity=1, user="Chef"):
+    return [order_date, "10:00:00", user, item, "Vegetables", "KG", quantity,
+            "2.00", f"{2 * quantity:.2f}", f"{2 * quantity:.2f}"]
+
+
+def write_legacy_log(orders_dir, rows, header=ORDER_COLUMNS):
+    orders_dir.mkdir(exist_ok=True)
+    with open(orders_dir / LEGACY_ORDERS_FILE_NAME, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def test_migrate_splits_legacy_log_by_month(tmp_path):
+    write_legacy_log(tmp_path, [order_row("2024-01-05"), order_row("2024-01-20"),
+                                order_row("2024-02-03"), order_row("2024-03-01"),
+                                ['', '', '', '', '', '', '', '', '', '']])
+
+    assert migrate_legacy_log(tmp_path)
+
+    partitions = load_manifest(tmp_path)
+    assert sorted(partitions) == ['2024-01', '2024-02', '2024-03']
+    assert [partitions[m]['rows'] for m in sorted(partitions)] == [2, 1, 1]
+    assert partitions['2024-01']['first_date'] == "2024-01-05"
+    assert partitions['2024-01']['last_date'] == "2024-01-20"
+
+    # Closed months are compressed, the newest one stays open
+    assert partitions['2024-01']['compressed'] and partitions['2024-02']['compressed']
+    assert not partitions['2024-03']['compressed']
+
+    assert not (tmp_path / LEGACY_ORDERS_FILE_NAME).exists()
+    assert (tmp_path / (LEGACY_ORDERS_FILE_NAME + '.migrated')).exists()
+    assert len(read_orders(orders_dir=tmp_path)) == 4
+    assert not migrate_legacy_log(tmp_path)
+
+
+def test_migrate_merges_into_existing_partitions(tmp_path):
+    append_order_rows([order_row("2024-02-10", "Onion"), order_row("2024-03-02", "Leek")], tmp_path)
+    old_files = {info['file'] for info in load_manifest(tmp_path).values()}
+
+    write_legacy_log(tmp_path, [order_row("2024-01-05"), order_row("2024-02-01")])
+    assert migrate_legacy_log(tmp_path)
+
+    partitions = load_manifest(tmp_path)
+    assert {m: info['rows'] for m, info in partitions.items()} == {'2024-01': 1, '2024-02': 2, '2024-03': 1}
+    assert sorted(read_orders(orders_dir=tmp_path)['Item Name']) == ['Leek', 'Onion', 'Tomato', 'Tomato']
+
+    # Replaced partitions are cleaned up
+    for file_name in old_files:
+        assert not (tmp_path / file_name).exists()
+
+
+def test_migrate_rejects_unexpected_header_and_keeps_data(tmp_path):
+    append_order_rows([order_row("2024-02-10")], tmp_path)
+    write_legacy_log(tmp_path, [["2024-01-05", "Tomato", 1]],
+                     header=['Order Date', 'Item Name', 'Quantity'])
+
+    with pytest.raises(ValueError, match="missing columns"):
+        migrate_legacy_log(tmp_path)
+
+    assert (tmp_path / LEGACY_ORDERS_FILE_NAME).exists()
+    assert len(read_orders(orders_dir=tmp_path)) == 1
+
+
+def test_migrate_normalises_dates_resaved_by_excel(tmp_path):
+    write_legacy_log(tmp_path, [order_row("1/6/2024"), order_row("2024/02/05"),
+                                order_row("2024-03-01")])
+
+    assert migrate_legacy_log(tmp_path)
+
+    partitions = load_manifest(tmp_path)
+    assert sorted(partitions) == ['2024-01', '2024-02', '2024-03']
+    assert partitions['2024-01']['first_date'] == "2024-01-06"
+    assert list(read_orders(orders_dir=tmp_path)['Order Date']) == ["2024-01-06", "2024-02-05",
+                                                                     "2024-03-01"]
+
+
+def test_migrate_rejects_unreadable_dates_and_keeps_data(tmp_path):
+    write_legacy_log(tmp_path, [order_row("2024-01-05"), order_row("sometime")])
+
+    with pytest.raises(ValueError, match="line\\(s\\) 3"):
+        migrate_legacy_log(tmp_path)
+
+    assert (tmp_path / LEGACY_ORDERS_FILE_NAME).exists()
+    assert load_manifest(tmp_path) == {}
+
+
+def test_interrupted_migration_is_finished_without_duplicates(tmp_path, monkeypatch):
+    write_legacy_log(tmp_path, [order_row("2024-01-05"), order_row("2024-02-01")])
+
+    # Crash between saving the manifest and renaming the legacy file
+    real_replace = order_log.os.replace
+
+    def crash_on_legacy_rename(source, target):
+        if str(source).endswith(LEGACY_ORDERS_FILE_NAME):
+            raise OSError("simulated crash")
+        real_replace(source, target)
+
+    monkeypatch.setattr(order_log.os, 'replace', crash_on_legacy_rename)
+    with pytest.raises(OSError):
+        migrate_legacy_log(tmp_path)
+    monkeypatch.setattr(order_log.os, 'replace', real_replace)
+
+    assert migrate_legacy_log(tmp_path)
+    assert not (tmp_path / LEGACY_ORDERS_FILE_NAME).exists()
+    assert len(read_orders(orders_dir=tmp_path)) == 2
+
+
+def test_late_order_reopens_compressed_month(tmp_path):
+    append_order_rows([order_row("2024-01-05")], tmp_path)
+    append_order_rows([order_row("2024-02-05")], tmp_path)
+    assert load_manifest(tmp_path)['2024-01']['compressed']
+
+    append_order_rows([order_row("2024-01-31", "Garlic")], tmp_path)
+
+    january = load_manifest(tmp_path)['2024-01']
+    assert january['rows'] == 2
+    assert january['last_date'] == "2024-01-31"
+    assert january['compressed']
+    assert sorted(f.name for f in tmp_path.glob("2024-01*")) == [january['file']]
+
+    df = read_orders("2024-01-01", "2024-01-31", orders_dir=tmp_path)
+    assert list(df['Item Name']) == ["Tomato", "Garlic"]
+
+
+def test_read_orders_prunes_partitions_by_date_range(tmp_path, monkeypatch):
+    append_order_rows([order_row("2024-01-05", "A"), order_row("2024-02-10", "B"),
+                       order_row("2024-02-20", "C"), order_row("2024-03-01", "D")], tmp_path)
+
+    assert [p.name[:7] for p in partitions_for_range("2024-02-15", "2024-02-28", tmp_path)] == ['2024-02']
+    assert [p.name[:7] for p in partitions_for_range("2024-02-25", None, tmp_path)] == ['2024-03']
+    assert len(partitions_for_range(None, None, tmp_path)) == 3
+
+    opened = []
+    real_read_csv = pd.read_csv
+
+    def tracking_read_csv(path, *args, **kwargs):
+        opened.append(path.name[:7])
+        return real_read_csv(path, *args, **kwargs)
+
+    monkeypatch.setattr(order_log.pd, 'read_csv', tracking_read_csv)
+    df = read_orders("2024-02-15", "2024-03-31", columns=['Item Name'], orders_dir=tmp_path)
+
+    assert opened == ['2024-02', '2024-03']
+    assert list(df.columns) == ['Item Name']
+    assert list(df['Item Name']) == ["C", "D"]
+
+
+def test_read_orders_does_not_wait_for_writers(tmp_path):
+    append_order_rows([order_row("2024-01-05")], tmp_path)
+    result = []
+
+    with order_log._locked(tmp_path):
+        reader = threading.Thread(target=lambda: result.append(read_orders(orders_dir=tmp_path)))
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+
+    assert len(result[0]) == 1
+
+
+def test_read_orders_retries_when_a_month_is_compressed_mid_read(tmp_path, monkeypatch):
+    append_order_rows([order_row("2024-01-05", "A"), order_row("2024-01-06", "B")], tmp_path)
+    real_read_csv = pd.read_csv
+    calls = []
+
+    def read_csv_during_compression(path, *args, **kwargs):
+        # A new month arrives after the reader listed January's open file
+        if not calls:
+            append_order_rows([order_row("2024-02-01", "C")], tmp_path)
+        calls.append(path.name)
+        return real_read_csv(path, *args, **kwargs)
+
+    monkeypatch.setattr(order_log.pd, 'read_csv', read_csv_during_compression)
+    df = read_orders(orders_dir=tmp_path)
+
+    assert calls[0] == "2024-01.csv"
+    assert list(df['Item Name']) == ["A", "B", "C"]
+
+
+def test_concurrent_appends_keep_manifest_consistent(tmp_path):
+    errors = []
+
+    def chef(n):
+        try:
+            for i in range(30):
+                month = 1 + (n + i) % 3
+                append_order_rows([order_row(f"2024-{month:02d}-{1 + i % 28:02d}", user=f"Chef {n}")],
+                                  tmp_path)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=chef, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sum(info['rows'] for info in load_manifest(tmp_path).values()) == 240
+    assert len(read_orders(orders_dir=tmp_path)) == 240
+    assert not list(tmp_path.glob("*.tmp"))